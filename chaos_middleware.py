@@ -1,10 +1,13 @@
 import os
 import random
-from typing import List, Optional, Any, Type, Callable
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import List, Optional, Any, Awaitable, Tuple, Type, Callable
 try:
-    from typing import TypedDict
+    from typing import NotRequired, TypedDict
 except ImportError:
-    from typing_extensions import TypedDict
+    from typing_extensions import NotRequired, TypedDict
 
 # Import LangChain v1 middleware types
 try:
@@ -28,6 +31,12 @@ except ImportError:
     ModelResponse = Any
     ToolCallRequest = Any
 
+# NumPy is optional and only used to pre-draw random numbers in batches
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class ChaosConfig(TypedDict):
     """Configuration for the Chaos Monkey Middleware.
     
@@ -38,6 +47,9 @@ class ChaosConfig(TypedDict):
         exclude_tools: List of tool names to exclude from chaos.
         seed: Random seed for reproducibility.
         safety_key: Environment variable name that must be "true" to enable chaos. Default: "ENABLE_CHAOS".
+        cache_ttl: Seconds between re-reads of `safety_key`. If None, it is read once at construction.
+        dynamic: If True, never replace the wrapper methods on the instance. Default: False.
+        batch_size: If set and NumPy is installed, pre-draw random numbers in blocks of this size.
     """
     failure_rate: float
     exception_types: List[Type[Exception]]
@@ -45,6 +57,193 @@ class ChaosConfig(TypedDict):
     exclude_tools: List[str]
     seed: Optional[int]
     safety_key: str
+    cache_ttl: NotRequired[Optional[float]]
+    dynamic: NotRequired[bool]
+    batch_size: NotRequired[Optional[int]]
+
+
+@dataclass(frozen=True, slots=True)
+class _ResolvedConfig:
+    """`ChaosConfig` with defaults applied and tool lists normalized."""
+    failure_rate: float
+    exception_types: Tuple[Type[Exception], ...]
+    include_tools: Optional[frozenset]
+    exclude_tools: frozenset
+    seed: Optional[int]
+    safety_key: str
+    cache_ttl: Optional[float]
+    dynamic: bool
+    batch_size: Optional[int]
+
+
+def _passthrough(request: Any, handler: Callable[[Any], Any]) -> Any:
+    """Calls the next handler without any chaos."""
+    return handler(request)
+
+
+async def _apassthrough(request: Any, handler: Callable[[Any], Awaitable[Any]]) -> Any:
+    """Awaits the next handler without any chaos."""
+    return await handler(request)
+
+
+def _make_safety_check(safety_key: str) -> Callable[[], bool]:
+    """Builds a callable that reports whether `safety_key` enables chaos."""
+    # Probe membership first: the variable is usually unset, and this skips
+    # building a default and lowercasing it
+    env_contains = os.environ.__contains__
+    env_getitem = os.environ.__getitem__
+
+    def is_enabled() -> bool:
+        return env_contains(safety_key) and env_getitem(safety_key).lower() == "true"
+    return is_enabled
+
+
+def _make_batch_roll(batch_size: int, rng: random.Random) -> Callable[[], float]:
+    """Builds a callable that returns uniforms pre-drawn `batch_size` at a time.
+    
+    Falls back to `rng.random` when NumPy is not installed.
+    """
+    if np is None:
+        return rng.random
+
+    # Seed NumPy from `rng` so a configured seed stays reproducible
+    generator = np.random.default_rng(rng.getrandbits(64))
+    pool = iter(())
+
+    def roll() -> float:
+        nonlocal pool
+        value = next(pool, None)
+        if value is None:
+            pool = iter(generator.random(batch_size).tolist())
+            value = next(pool)
+        return value
+    return roll
+
+
+def _make_trigger(
+    failure_rate: float,
+    exception_types: Tuple[Type[Exception], ...],
+    rng: random.Random,
+    message: str,
+    batch_size: Optional[int] = None,
+) -> Callable[[], None]:
+    """Builds a callable that rolls the dice and raises on failure.
+    
+    Args:
+        failure_rate: Probability of failure (0.0 to 1.0).
+        exception_types: Exception classes to choose from when failing.
+        rng: Random number generator to draw from.
+        message: Message of the generic exception raised when
+            `exception_types` is empty.
+        batch_size: If set, draw the dice rolls in blocks of this size.
+    """
+    if failure_rate <= 0.0:
+        return lambda: None
+
+    roll = _make_batch_roll(batch_size, rng) if batch_size else rng.random
+    # Zero-argument exception factories; a fresh exception is built per failure
+    factories = exception_types or (partial(Exception, message),)
+    if len(factories) == 1:
+        # Nothing to choose, so skip the extra draw
+        factory = factories[0]
+
+        def trigger() -> None:
+            if roll() <= failure_rate:
+                raise factory()
+    else:
+        choice = rng.choice
+
+        def trigger() -> None:
+            if roll() <= failure_rate:
+                raise choice(factories)()
+    return trigger
+
+
+def _fallback_tool_name(request: Any) -> Optional[str]:
+    """Gets the tool name from a request without a named `tool`.
+    
+    Covers bare tool call dicts and ToolCallRequests for tools that are not
+    registered with the agent (`request.tool` is None).
+    """
+    tool_call = request if isinstance(request, dict) else getattr(request, 'tool_call', None)
+    if isinstance(tool_call, dict):
+        return tool_call.get("name")
+    return None
+
+
+def _make_tool_filter(
+    include_tools: Optional[frozenset],
+    exclude_tools: frozenset,
+) -> Optional[Callable[[Optional[str]], bool]]:
+    """Builds a predicate that reports whether a tool name is targeted.
+    
+    Returns None if every tool is targeted.
+    """
+    if include_tools is None:
+        if not exclude_tools:
+            return None
+        return lambda tool_name: tool_name not in exclude_tools
+    # Fold the exclusions in so targeting is a single membership check
+    return (include_tools - exclude_tools).__contains__
+
+
+def _make_wrappers(
+    trigger: Callable[[], None],
+) -> Tuple[Callable[..., Any], Callable[..., Awaitable[Any]]]:
+    """Builds sync and async wrappers that roll the dice on every call."""
+    def wrap_call(request: Any, handler: Callable[[Any], Any]) -> Any:
+        # Roll Dice
+        trigger()
+
+        return handler(request)
+
+    async def awrap_call(request: Any, handler: Callable[[Any], Awaitable[Any]]) -> Any:
+        trigger()
+
+        return await handler(request)
+    return wrap_call, awrap_call
+
+
+def _make_tool_wrappers(
+    targeted: Optional[Callable[[Optional[str]], bool]],
+    trigger: Callable[[], None],
+) -> Tuple[Callable[..., Any], Callable[..., Awaitable[Any]]]:
+    """Builds sync and async tool call wrappers with the tool filter bound as a local."""
+    if targeted is None:
+        # Every tool is targeted, so skip extracting the tool name
+        return _make_wrappers(trigger)
+
+    def wrap_tool_call(request: Any, handler: Callable[[Any], Any]) -> Any:
+        # Extract tool name from request
+        # The request object should have a 'tool' attribute with the BaseTool instance
+        try:
+            tool_name = request.tool.name
+        except AttributeError:
+            tool_name = _fallback_tool_name(request)
+        
+        # Target Check
+        if not targeted(tool_name):
+            return handler(request)
+
+        # Roll Dice
+        trigger()
+
+        return handler(request)
+
+    async def awrap_tool_call(request: Any, handler: Callable[[Any], Awaitable[Any]]) -> Any:
+        try:
+            tool_name = request.tool.name
+        except AttributeError:
+            tool_name = _fallback_tool_name(request)
+        
+        if not targeted(tool_name):
+            return await handler(request)
+
+        trigger()
+
+        return await handler(request)
+    return wrap_tool_call, awrap_tool_call
+
 
 class ChaosMiddleware(AgentMiddleware):
     """Middleware that injects random failures into tool and model calls.
@@ -55,18 +254,103 @@ class ChaosMiddleware(AgentMiddleware):
     !!!Important!!!
         The middleware will ONLY be active if the environment variable specified
         by `safety_key` (default: "ENABLE_CHAOS") is set to "true".
+        The variable is read once at construction; call `refresh_safety()`
+        after changing it, or set `cache_ttl` to re-read it periodically.
+        
+        Unless `dynamic` is set, the wrapper methods are replaced on the
+        instance with versions specialized for the configuration (plain
+        pass-throughs if the middleware can never fail). Agents capture the
+        wrappers when they are built, so rebuild the agent after
+        `refresh_safety()`, or set `dynamic` to True.
     """
     def __init__(self, config: ChaosConfig):
-        self.config = config
-        self.failure_rate = config.get("failure_rate", 0.1)
-        self.exception_types = config.get("exception_types", [])
-        self.include_tools = config.get("include_tools", None)
-        self.exclude_tools = config.get("exclude_tools", [])
-        self.seed = config.get("seed", None)
-        self.safety_key = config.get("safety_key", "ENABLE_CHAOS")
+        include_tools = config.get("include_tools", None)
+        self._cfg = cfg = _ResolvedConfig(
+            failure_rate=config.get("failure_rate", 0.1),
+            exception_types=tuple(config.get("exception_types", [])),
+            # Normalize tool lists to frozensets for O(1) membership checks
+            include_tools=None if include_tools is None else frozenset(include_tools),
+            exclude_tools=frozenset(config.get("exclude_tools", None) or ()),
+            seed=config.get("seed", None),
+            safety_key=config.get("safety_key", "ENABLE_CHAOS"),
+            cache_ttl=config.get("cache_ttl", None),
+            dynamic=config.get("dynamic", False),
+            batch_size=config.get("batch_size", None),
+        )
+        self._safety_check = _make_safety_check(cfg.safety_key)
+        # Own RNG so seeding doesn't touch the global `random` state
+        self._rng = random.Random(cfg.seed)
+        self._tool_trigger = _make_trigger(
+            cfg.failure_rate, cfg.exception_types, self._rng,
+            "Chaos Monkey triggered!", cfg.batch_size,
+        )
+        self._model_trigger = _make_trigger(
+            cfg.failure_rate, cfg.exception_types, self._rng,
+            "Chaos Monkey triggered on model call!", cfg.batch_size,
+        )
+        self._wrap_tool_call, self._awrap_tool_call = _make_tool_wrappers(
+            _make_tool_filter(cfg.include_tools, cfg.exclude_tools),
+            self._tool_trigger,
+        )
+        self._wrap_model_call, self._awrap_model_call = _make_wrappers(
+            self._model_trigger
+        )
+
+        self.refresh_safety()
+
+    @property
+    def config(self) -> ChaosConfig:
+        """The configuration in effect, with defaults applied.
         
-        if self.seed is not None:
-            random.seed(self.seed)
+        Built on each access; modifying it does not affect the middleware.
+        """
+        cfg = self._cfg
+        return {
+            "failure_rate": cfg.failure_rate,
+            "exception_types": list(cfg.exception_types),
+            "include_tools": None if cfg.include_tools is None else sorted(cfg.include_tools),
+            "exclude_tools": sorted(cfg.exclude_tools),
+            "seed": cfg.seed,
+            "safety_key": cfg.safety_key,
+            "cache_ttl": cfg.cache_ttl,
+            "dynamic": cfg.dynamic,
+            "batch_size": cfg.batch_size,
+        }
+
+    def refresh_safety(self) -> bool:
+        """Re-reads the safety environment variable and rebinds the wrappers.
+        
+        Returns:
+            True if chaos is enabled.
+        """
+        self._read_safety()
+        self._specialize()
+        return self._enabled
+
+    def _read_safety(self) -> None:
+        """Resolves the safety environment variable into `_enabled`."""
+        self._enabled = self._safety_check()
+        cache_ttl = self._cfg.cache_ttl
+        self._safety_expires_at = None if cache_ttl is None else time.monotonic() + cache_ttl
+
+    def _specialize(self) -> None:
+        """Binds the wrappers specialized for the current configuration.
+        
+        The generic methods are kept when the safety check can change between
+        calls (`cache_ttl`) or `dynamic` is set.
+        """
+        cfg = self._cfg
+        if cfg.dynamic or (cfg.cache_ttl is not None and cfg.failure_rate > 0.0):
+            for name in ("wrap_tool_call", "awrap_tool_call", "wrap_model_call", "awrap_model_call"):
+                vars(self).pop(name, None)
+        elif cfg.failure_rate <= 0.0 or not self._enabled:
+            self.wrap_tool_call = self.wrap_model_call = _passthrough
+            self.awrap_tool_call = self.awrap_model_call = _apassthrough
+        else:
+            self.wrap_tool_call = self._wrap_tool_call
+            self.awrap_tool_call = self._awrap_tool_call
+            self.wrap_model_call = self._wrap_model_call
+            self.awrap_model_call = self._awrap_model_call
 
     def wrap_tool_call(
         self, 
@@ -86,31 +370,13 @@ class ChaosMiddleware(AgentMiddleware):
             Exception: A random exception from `exception_types` if chaos is triggered.
         """
         # Safety Check
-        if os.environ.get(self.safety_key, "").lower() != "true":
+        expires_at = self._safety_expires_at
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._read_safety()
+        if not self._enabled:
             return handler(request)
 
-        # Extract tool name from request
-        # The request object should have a 'tool' attribute with the BaseTool instance
-        tool_name = getattr(request, 'tool', None)
-        if tool_name is not None:
-            tool_name = getattr(tool_name, 'name', str(tool_name))
-        
-        # Target Check
-        if tool_name and tool_name in self.exclude_tools:
-            return handler(request)
-        
-        if self.include_tools is not None and (not tool_name or tool_name not in self.include_tools):
-            return handler(request)
-
-        # Roll Dice
-        if random.random() <= self.failure_rate:
-            if self.exception_types:
-                # Instantiate the exception class
-                raise random.choice(self.exception_types)()
-            else:
-                raise Exception("Chaos Monkey triggered!")
-
-        return handler(request)
+        return self._wrap_tool_call(request, handler)
 
     def wrap_model_call(
         self, 
@@ -130,18 +396,65 @@ class ChaosMiddleware(AgentMiddleware):
             Exception: A random exception from `exception_types` if chaos is triggered.
         """
         # Safety Check
-        if os.environ.get(self.safety_key, "").lower() != "true":
+        expires_at = self._safety_expires_at
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._read_safety()
+        if not self._enabled:
             return handler(request)
 
-        # Roll Dice
-        if random.random() <= self.failure_rate:
-            if self.exception_types:
-                # Instantiate the exception class
-                raise random.choice(self.exception_types)()
-            else:
-                raise Exception("Chaos Monkey triggered on model call!")
+        return self._wrap_model_call(request, handler)
 
-        return handler(request)
+    async def awrap_tool_call(
+        self, 
+        request: ToolCallRequest, 
+        handler: Callable[[ToolCallRequest], Awaitable[Any]]
+    ) -> Any:
+        """Async version of `wrap_tool_call`.
+        
+        Args:
+            request: The ToolCallRequest object containing tool information.
+            handler: The next async handler in the chain.
+            
+        Returns:
+            The result of the handler if no exception is raised.
+            
+        Raises:
+            Exception: A random exception from `exception_types` if chaos is triggered.
+        """
+        # Safety Check
+        expires_at = self._safety_expires_at
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._read_safety()
+        if not self._enabled:
+            return await handler(request)
+
+        return await self._awrap_tool_call(request, handler)
+
+    async def awrap_model_call(
+        self, 
+        request: ModelRequest, 
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]]
+    ) -> ModelResponse:
+        """Async version of `wrap_model_call`.
+        
+        Args:
+            request: The ModelRequest object.
+            handler: The next async handler in the chain.
+            
+        Returns:
+            The ModelResponse if no exception is raised.
+            
+        Raises:
+            Exception: A random exception from `exception_types` if chaos is triggered.
+        """
+        # Safety Check
+        expires_at = self._safety_expires_at
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._read_safety()
+        if not self._enabled:
+            return await handler(request)
+
+        return await self._awrap_model_call(request, handler)
 
 # Custom Exceptions for Chaos
 class RateLimitError(Exception):
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import random
 import unittest
 from unittest.mock import Mock
 from chaos_middleware import ChaosMiddleware, NETWORK_ERRORS
@@ -119,6 +121,277 @@ class TestChaosMiddleware(unittest.TestCase):
         with self.assertRaises(ValueError):
             middleware.wrap_model_call(self.model_request, self.handler)
 
+    def test_refresh_safety(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        middleware = ChaosMiddleware(config)
+        
+        # Safety key is cached until refreshed
+        del os.environ["ENABLE_CHAOS"]
+        with self.assertRaises(ValueError):
+            middleware.wrap_tool_call(self.tool_request, self.handler)
+        
+        self.assertFalse(middleware.refresh_safety())
+        result = middleware.wrap_tool_call(self.tool_request, self.handler)
+        self.assertEqual(result, "success")
+
+    def test_cache_ttl(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS",
+            "cache_ttl": 0
+        }
+        middleware = ChaosMiddleware(config)
+        
+        # A zero TTL re-reads the safety key on every call
+        del os.environ["ENABLE_CHAOS"]
+        result = middleware.wrap_tool_call(self.tool_request, self.handler)
+        self.assertEqual(result, "success")
+
+    def test_inert_specialization(self):
+        if "ENABLE_CHAOS" in os.environ:
+            del os.environ["ENABLE_CHAOS"]
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        middleware = ChaosMiddleware(config)
+        wrap_tool_call = middleware.wrap_tool_call
+        
+        # Wrappers captured while disabled stay pass-throughs
+        os.environ["ENABLE_CHAOS"] = "true"
+        self.assertTrue(middleware.refresh_safety())
+        result = wrap_tool_call(self.tool_request, self.handler)
+        self.assertEqual(result, "success")
+        
+        with self.assertRaises(ValueError):
+            middleware.wrap_tool_call(self.tool_request, self.handler)
+
+    def test_dynamic(self):
+        if "ENABLE_CHAOS" in os.environ:
+            del os.environ["ENABLE_CHAOS"]
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS",
+            "dynamic": True
+        }
+        middleware = ChaosMiddleware(config)
+        wrap_tool_call = middleware.wrap_tool_call
+        
+        # Wrappers captured while disabled pick up a refresh
+        os.environ["ENABLE_CHAOS"] = "true"
+        middleware.refresh_safety()
+        with self.assertRaises(ValueError):
+            wrap_tool_call(self.tool_request, self.handler)
+
+    def test_seed_isolated_from_global_random(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 0.5,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        
+        def outcomes(middleware):
+            results = []
+            for _ in range(20):
+                try:
+                    middleware.wrap_model_call(self.model_request, self.handler)
+                    results.append(True)
+                except ValueError:
+                    results.append(False)
+            return results
+        
+        state = random.getstate()
+        first = ChaosMiddleware(config)
+        self.assertEqual(random.getstate(), state)
+        
+        # Interleaved instances with the same seed produce the same outcomes
+        second = ChaosMiddleware(config)
+        random.random()
+        self.assertEqual(outcomes(first), outcomes(second))
+
+    def test_default_exception(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        middleware = ChaosMiddleware(config)
+        
+        with self.assertRaisesRegex(Exception, "^Chaos Monkey triggered!$"):
+            middleware.wrap_tool_call(self.tool_request, self.handler)
+        
+        with self.assertRaisesRegex(Exception, "on model call"):
+            middleware.wrap_model_call(self.model_request, self.handler)
+
+    def test_batch_size(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 0.5,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS",
+            "batch_size": 8
+        }
+        
+        def outcomes(middleware):
+            results = []
+            # Cross a batch boundary
+            for _ in range(20):
+                try:
+                    middleware.wrap_tool_call(self.tool_request, self.handler)
+                    results.append(True)
+                except ValueError:
+                    results.append(False)
+            return results
+        
+        first = outcomes(ChaosMiddleware(config))
+        self.assertEqual(first, outcomes(ChaosMiddleware(config)))
+        self.assertIn(True, first)
+        self.assertIn(False, first)
+
+    def test_config(self):
+        config = {
+            "failure_rate": 0.5,
+            "exception_types": NETWORK_ERRORS,
+            "include_tools": ["b_tool", "a_tool"],
+            "seed": 42
+        }
+        middleware = ChaosMiddleware(config)
+        
+        self.assertEqual(middleware.config, {
+            "failure_rate": 0.5,
+            "exception_types": NETWORK_ERRORS,
+            "include_tools": ["a_tool", "b_tool"],
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS",
+            "cache_ttl": None,
+            "dynamic": False,
+            "batch_size": None
+        })
+
+    def test_async_calls(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": ["safe_tool"],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        
+        async def handler(request):
+            return "success"
+        
+        for dynamic in (False, True):
+            middleware = ChaosMiddleware(dict(config, dynamic=dynamic))
+            
+            safe_request = MockToolCallRequest("safe_tool")
+            result = asyncio.run(middleware.awrap_tool_call(safe_request, handler))
+            self.assertEqual(result, "success")
+            
+            with self.assertRaises(ValueError):
+                asyncio.run(middleware.awrap_tool_call(self.tool_request, handler))
+            
+            with self.assertRaises(ValueError):
+                asyncio.run(middleware.awrap_model_call(self.model_request, handler))
+
+    def test_single_exception_type(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 0.5,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": [],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        middleware = ChaosMiddleware(config)
+        
+        # Only the dice roll draws from the RNG
+        rng = random.Random(42)
+        for _ in range(20):
+            if rng.random() <= 0.5:
+                with self.assertRaises(ValueError):
+                    middleware.wrap_model_call(self.model_request, self.handler)
+            else:
+                result = middleware.wrap_model_call(self.model_request, self.handler)
+                self.assertEqual(result, "success")
+
+    def test_include_and_exclude_tools(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [ValueError],
+            "include_tools": ["risky_tool", "safe_tool"],
+            "exclude_tools": ["safe_tool"],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        middleware = ChaosMiddleware(config)
+        
+        # Exclusion wins over inclusion
+        for name in ("safe_tool", "test_tool"):
+            result = middleware.wrap_tool_call(MockToolCallRequest(name), self.handler)
+            self.assertEqual(result, "success")
+        
+        with self.assertRaises(ValueError):
+            middleware.wrap_tool_call(MockToolCallRequest("risky_tool"), self.handler)
+
+    def test_tool_name_fallbacks(self):
+        os.environ["ENABLE_CHAOS"] = "true"
+        config = {
+            "failure_rate": 1.0,
+            "exception_types": [ValueError],
+            "include_tools": None,
+            "exclude_tools": ["safe_tool"],
+            "seed": 42,
+            "safety_key": "ENABLE_CHAOS"
+        }
+        middleware = ChaosMiddleware(config)
+        
+        # Unregistered tool: no BaseTool, name only in the tool call
+        unregistered = Mock(tool=None, tool_call={"name": "safe_tool", "args": {}, "id": "1"})
+        tool_call = {"name": "safe_tool", "args": {}, "id": "1"}
+        for request in (unregistered, tool_call):
+            result = middleware.wrap_tool_call(request, self.handler)
+            self.assertEqual(result, "success")
+        
+        with self.assertRaises(ValueError):
+            middleware.wrap_tool_call(dict(tool_call, name="test_tool"), self.handler)
+
 
 if __name__ == "__main__":
     unittest.main()